@@ -1,15 +1,21 @@
 from contextlib import asynccontextmanager
+import aiofiles
 from fastapi import Depends, FastAPI, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
-import shutil
+import hashlib
 import uuid
 import logging
 
+from embeddings.encoder import EmbeddingEncoder
+from generation.llm_client import LLMClient
 from pipeline.ingest_document import ingest_document
 from pipeline.query_pipeline import run_query_pipeline
 from pipeline.conversation_memory import ConversationMemory, ConversationTurn
+from retrieval.cross_encoder import CrossEncoderReranker
 from api import dependencies
 from api.auth import (
     AuthError,
@@ -22,6 +28,7 @@ from configs.settings import settings
 
 import gc
 import os
+import time
 
 # Force single thread for torch to save CPU/memory overhead on small instances
 os.environ["OMP_NUM_THREADS"] = "1"
@@ -74,10 +81,34 @@ def _resolve_session(
     return _create_session(user_id, "Research Session")
 
 
+def _warm_models():
+    """
+    Run a tiny forward pass through each model so the first real request
+    doesn't pay for model loading, tokenizer init, and kernel warmup.
+    """
+    warmup_phases = (
+        ("encoder", lambda: dependencies.get_encoder().embed_query("warmup")),
+        ("reranker", lambda: dependencies.get_reranker().rerank(
+            "warmup", [{"text": "warmup"}], top_n=1
+        )),
+    )
+    for name, phase in warmup_phases:
+        t0 = time.perf_counter()
+        try:
+            phase()
+            logger.info("Warmed %s in %.1fs", name, time.perf_counter() - t0)
+        except Exception as e:
+            logger.warning("Warmup of %s failed: %s", name, e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Models will load lazily on first request to avoid deployment timeouts
     logger.info(f"ResearchMind RAG system starting on {settings.PROJECT_NAME}")
+    if settings.WARMUP_ON_STARTUP:
+        _warm_models()
+    else:
+        # Models load lazily on first request to avoid deployment timeouts
+        logger.info("Startup warmup disabled — models load on first request.")
     yield
     logger.info("Application shutting down.")
 
@@ -87,6 +118,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -168,32 +200,70 @@ def auth_me(current_user: AuthenticatedUser = Depends(get_current_user)):
 
 
 @app.post("/upload")
-def upload_pdf(
+async def upload_pdf(
     file: UploadFile = File(...),
     session_id: Optional[str] = None,
     current_user: AuthenticatedUser = Depends(get_current_user),
+    encoder: EmbeddingEncoder = Depends(dependencies.get_encoder),
 ):
     """Upload and index a PDF document."""
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    file_id = f"{uuid.uuid4().hex}.pdf"
+    max_bytes = settings.MAX_UPLOAD_MB * 1024 * 1024
+    if file.size and file.size > max_bytes:
+        raise HTTPException(status_code=413, detail="File too large")
+
     upload_dir = settings.UPLOAD_DIR / current_user.user_id
     upload_dir.mkdir(parents=True, exist_ok=True)
-    file_path = upload_dir / file_id
+    # Temporary name while streaming; renamed to the content hash below
+    file_path = upload_dir / f"{uuid.uuid4().hex}.pdf.part"
 
+    # Stream to disk in 1 MiB chunks, hashing as we go and yielding the
+    # event loop between chunks so /ask requests aren't starved.
     try:
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        received = 0
+        hasher = hashlib.sha256()
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(1 << 20):
+                received += len(chunk)
+                if received > max_bytes:
+                    raise HTTPException(status_code=413, detail="File too large")
+                hasher.update(chunk)
+                await f.write(chunk)
+    except HTTPException:
+        file_path.unlink(missing_ok=True)
+        raise
     except Exception as e:
         logger.error("File save error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to save file")
 
+    # Content-addressed filename: identical PDFs land on the same path,
+    # and the hash prefix matches PDFLoader's doc_id, so a re-upload of an
+    # already-indexed document skips embedding entirely.
+    content_hash = hasher.hexdigest()
+    final_path = upload_dir / f"{content_hash}.pdf"
+    file_path.replace(final_path)
+    file_path = final_path
+
+    index = dependencies.get_index(current_user.user_id)
+    doc_id = content_hash[:16]
+    if doc_id in index.get_doc_ids():
+        logger.info("Document %s already indexed — skipping ingestion.", doc_id)
+        _, session = _resolve_session(current_user.user_id, session_id, create_if_missing=True)
+        session.register_document(doc_id, file.filename, index.chunk_count)
+        return {
+            "status": "already_indexed",
+            "doc_id": doc_id,
+            "filename": file.filename,
+            "chunk_count": index.chunk_count,
+            "document_count": index.document_count,
+        }
+
     try:
-        encoder = dependencies.get_encoder()
-        index = dependencies.get_index(current_user.user_id)
         logger.info("Ingesting new document: %s", file.filename)
-        doc_id = ingest_document(file_path, encoder, index)
+        # Ingestion is CPU-heavy and sync — run it off the event loop
+        doc_id = await run_in_threadpool(ingest_document, file_path, encoder, index)
     except Exception as e:
         logger.error("Ingestion error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to ingest document")
@@ -220,6 +290,9 @@ def upload_pdf(
 def ask_question(
     req: QuestionRequest,
     current_user: AuthenticatedUser = Depends(get_current_user),
+    encoder: EmbeddingEncoder = Depends(dependencies.get_encoder),
+    reranker: CrossEncoderReranker = Depends(dependencies.get_reranker),
+    llm: LLMClient = Depends(dependencies.get_llm_client),
 ):
     """Ask a question against the indexed documents with optional memory context."""
     if not req.question.strip():
@@ -235,10 +308,7 @@ def ask_question(
     pinned_context = session.get_pins_context() if req.use_memory_context else ""
 
     try:
-        encoder = dependencies.get_encoder()
         index = dependencies.get_index(current_user.user_id)
-        reranker = dependencies.get_reranker()
-        llm = dependencies.get_llm_client()
 
         # Determine document scope: request-level doc_id overrides session-level docs
         if req.doc_id:
@@ -398,6 +468,31 @@ def clear_index(current_user: AuthenticatedUser = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail="Failed to clear index")
 
 
+@app.delete("/index/{doc_id}")
+def remove_document(
+    doc_id: str,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """Remove a single document from the index without re-ingesting the rest."""
+    index = dependencies.get_index(current_user.user_id)
+    removed = index.remove_document(doc_id)
+    if removed == 0:
+        raise HTTPException(status_code=404, detail="Document not found in index")
+
+    index.save()
+    for session in _get_user_sessions(current_user.user_id).values():
+        session.active_docs[:] = [
+            d for d in session.active_docs if d.get("doc_id") != doc_id
+        ]
+
+    return {
+        "status": "removed",
+        "doc_id": doc_id,
+        "chunks_removed": removed,
+        "chunk_count": index.chunk_count,
+    }
+
+
 @app.get("/index/status")
 def index_status(current_user: AuthenticatedUser = Depends(get_current_user)):
     index = dependencies.get_index(current_user.user_id)
@@ -1,3 +1,4 @@
+import functools
 import logging
 from pathlib import Path
 from embeddings.encoder import EmbeddingEncoder
@@ -8,19 +9,15 @@ from configs.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Global singleton instances
-_encoder: EmbeddingEncoder | None = None
+# Per-user index instances (keyed by user_id, so not lru_cache-able with
+# a fixed size of one)
 _indexes: dict[str, FaissIndex] = {}
-_reranker: CrossEncoderReranker | None = None
-_llm_client: LLMClient | None = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_encoder() -> EmbeddingEncoder:
-    global _encoder
-    if _encoder is None:
-        logger.info("Initializing EmbeddingEncoder...")
-        _encoder = EmbeddingEncoder()
-    return _encoder
+    logger.info("Initializing EmbeddingEncoder...")
+    return EmbeddingEncoder()
 
 
 def _user_index_paths(user_id: str) -> tuple[Path, Path]:
@@ -40,20 +37,16 @@ def get_index(user_id: str) -> FaissIndex:
     return _indexes[user_id]
 
 
+@functools.lru_cache(maxsize=1)
 def get_reranker() -> CrossEncoderReranker:
-    global _reranker
-    if _reranker is None:
-        logger.info("Initializing CrossEncoderReranker...")
-        _reranker = CrossEncoderReranker()
-    return _reranker
+    logger.info("Initializing CrossEncoderReranker...")
+    return CrossEncoderReranker()
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm_client() -> LLMClient:
-    global _llm_client
-    if _llm_client is None:
-        logger.info("Initializing LLMClient...")
-        _llm_client = LLMClient()
-    return _llm_client
+    logger.info("Initializing LLMClient...")
+    return LLMClient()
 
 
 def clear_index(user_id: str):
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "llama3-70b-8192"
     LLM_TEMPERATURE: float = 0.0
     LLM_MAX_TOKENS: int = 1024
+    # Completions cached per process, keyed by exact prompt. Sound at
+    # temperature 0 where repeated prompts are deterministic; 0 disables.
+    LLM_RESPONSE_CACHE_SIZE: int = 512
 
     # Monitoring Configuration
     LANGCHAIN_TRACING_V2: str = "false"
@@ -34,6 +37,11 @@ class Settings(BaseSettings):
     RERANKER_MODEL_NAME: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
     RERANKER_MAX_PASSAGES: int = 5
     RERANKER_TOP_N: int = 5
+    # Skip the cross-encoder when FAISS is already decisive: top-1 cosine
+    # at or above RERANK_SKIP_TOP1 and leading the last retrieved hit by
+    # at least RERANK_SKIP_MARGIN. Set RERANK_SKIP_TOP1 to 0 to disable.
+    RERANK_SKIP_TOP1: float = 0.85
+    RERANK_SKIP_MARGIN: float = 0.15
 
     # Verification Thresholds
     # 0.55 is calibrated for all-MiniLM-L6-v2 cosine similarity;
@@ -48,17 +56,66 @@ class Settings(BaseSettings):
     USERS_PATH: Path = AUTH_DIR / "users.json"
     UPLOAD_DIR: Path = STORAGE_DIR / "uploads"
     INDEX_DIR: Path = STORAGE_DIR / "index"
+    QUERY_CACHE_DIR: Path = STORAGE_DIR / "cache" / "queries"
+
+    # Embedding Cache
+    QUERY_CACHE_SIZE: int = 4096
+    # Max .npy entries kept in the on-disk query cache; the oldest are
+    # evicted in periodic sweeps once the cap is exceeded.
+    QUERY_CACHE_DISK_ENTRIES: int = 16384
     
     # Faiss Index Paths
     FAISS_INDEX_PATH: Path = INDEX_DIR / "faiss.index"
     FAISS_META_PATH: Path = INDEX_DIR / "chunks.pkl"
 
+    # Faiss Index Tuning
+    # Below this chunk count an exact flat scan is cheap; above it the
+    # index is migrated to IVF-PQ for sub-linear search.
+    FAISS_IVF_MIN_CHUNKS: int = 10_000
+    FAISS_NPROBE: int = 8
+    # ANN index built at the migration threshold: "ivfpq" (PQ-compressed,
+    # smallest memory) or "hnsw" (graph traversal, best recall/latency,
+    # keeps full vectors in RAM).
+    FAISS_ANN_INDEX: str = "ivfpq"
+    FAISS_HNSW_M: int = 32
+    FAISS_HNSW_EF_SEARCH: int = 64
+    # Memory-map the persisted index instead of materializing it in RAM.
+    # Read-only: good for query-serving replicas, incompatible with /upload.
+    FAISS_MMAP: bool = False
+    # Store vectors as fp16 scalar-quantized codes (half the memory
+    # bandwidth per scan, negligible recall loss on normalized MiniLM).
+    FAISS_FP16: bool = False
+    # Store vectors as int8 scalar-quantized codes instead: 4x less
+    # bandwidth than fp32. Per-dimension ranges are trained on the first
+    # added batch. Takes precedence over FAISS_FP16.
+    FAISS_INT8: bool = False
+
+    # Upload Limits
+    MAX_UPLOAD_MB: int = 100
+
     # Auth Configuration
     AUTH_SECRET_KEY: str = "change-me-before-production"
     AUTH_TOKEN_TTL_HOURS: int = 24
 
     # Optimization
     USE_GPU: bool = False
+    # Intra-op threads for CPU inference; 0 means one per CPU core.
+    # PyTorch's default is sometimes 1 on containerized deployments,
+    # which serializes BERT matmuls.
+    TORCH_NUM_THREADS: int = 0
+    # Pre-load and warm the encoder/reranker models at startup. Disable on
+    # platforms that kill slow-booting workers (deployment health checks).
+    WARMUP_ON_STARTUP: bool = True
+    # Compile the cross-encoder with torch.compile(mode="reduce-overhead").
+    # Worthwhile on GPU or beefy CPU boxes; adds startup compile time.
+    TORCH_COMPILE_RERANKER: bool = False
+    # Run MiniLM through ONNX Runtime with dynamic int8 quantization
+    # (CPU-only; requires the optimum/onnxruntime extras).
+    USE_ONNX_INT8: bool = False
+    # Keep the shared sentence-transformer in fp16 on GPU: half the
+    # weight/activation bandwidth, ~2x encode throughput, <1e-3 cosine
+    # drift on MiniLM. Ignored on CPU.
+    ENCODER_FP16: bool = True
 
 
 settings = Settings()
@@ -1,43 +1,208 @@
+import functools
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
 from typing import List, Dict, Optional
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from configs.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Saves between on-disk query cache sweeps — listing the cache directory
+# on every save would put an O(entries) scan in the encode path.
+_DISK_SWEEP_INTERVAL = 256
+
+
+@functools.lru_cache(maxsize=1)
+def configure_torch() -> None:
+    """
+    One-time process-wide torch tuning, applied before any model loads.
+
+    Matches intra-op threads to the machine (containerized defaults are
+    sometimes a single thread, serializing every BERT matmul) and allows
+    TF32 matmuls on GPU — both pure-throughput settings with no effect
+    on results beyond float rounding.
+    """
+    import torch
+
+    threads = settings.TORCH_NUM_THREADS or (os.cpu_count() or 4)
+    torch.set_num_threads(threads)
+    if settings.USE_GPU:
+        torch.backends.cuda.matmul.allow_tf32 = True
+    logger.info("Torch configured: %d intra-op threads.", threads)
+
+
+@functools.lru_cache(maxsize=4)
+def load_sentence_transformer(model_name: str, device: str) -> SentenceTransformer:
+    """
+    Load a sentence-transformer, preferring the int8 ONNX Runtime backend
+    when enabled.
+
+    Cached per (model_name, device): every component that asks for the
+    same weights — encoder, verifier, tests spinning up fresh instances —
+    gets the one loaded copy instead of paying the disk load again.
+
+    Dynamic int8 quantization roughly halves model size and doubles CPU
+    throughput with negligible retrieval-quality loss, which matters here
+    because every /ask pays a MiniLM forward pass. Falls back to the
+    standard PyTorch backend if optimum/onnxruntime are not installed or
+    no quantized export exists for the model.
+    """
+    configure_torch()
+    if settings.USE_ONNX_INT8:
+        try:
+            return SentenceTransformer(
+                model_name,
+                device="cpu",
+                backend="onnx",
+                model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"},
+            )
+        except Exception as e:
+            logger.warning(
+                "ONNX int8 backend unavailable (%s) — falling back to PyTorch.", e
+            )
+    model = SentenceTransformer(model_name, device=device)
+    if device == "cuda" and settings.ENCODER_FP16:
+        model = model.half()
+    return model
+
+
+def get_shared_model() -> SentenceTransformer:
+    """
+    Return the process-wide embedding model, loading it on first use.
+
+    EmbeddingEncoder and AnswerVerifier use the same MiniLM weights, so
+    loading them twice would double RAM (~90 MB) and startup latency for
+    nothing.
+    """
+    device = "cuda" if settings.USE_GPU else "cpu"
+    return load_sentence_transformer(settings.EMBEDDING_MODEL_NAME, device)
+
 
 class EmbeddingEncoder:
     """
     High-performance embedding encoder with query caching.
-    
+
+    Query embeddings are cached at two levels: a bounded in-memory LRU
+    for the hot path, backed by an on-disk store keyed by
+    SHA-256(model_name + query) so warm restarts skip the model entirely.
+
     Ideally should be instantiated once as a singleton to avoid reloading the model.
     """
 
     def __init__(
         self,
         model_name: str = settings.EMBEDDING_MODEL_NAME,
-        device: str = "cuda" if settings.USE_GPU else "cpu"
+        device: str = "cuda" if settings.USE_GPU else "cpu",
+        cache_dir: Optional[Path] = None,
     ):
-        self.model = SentenceTransformer(model_name, device=device)
-        self._query_cache: Dict[str, np.ndarray] = {}
+        self.model_name = model_name
+        if model_name == settings.EMBEDDING_MODEL_NAME:
+            self.model = get_shared_model()
+        else:
+            self.model = load_sentence_transformer(model_name, device)
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_dir = cache_dir or settings.QUERY_CACHE_DIR
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._saves_since_sweep = 0
 
     def embed_query(self, query: str) -> np.ndarray:
         """
-        Embed a query with in-memory caching.
+        Embed a query with LRU in-memory caching and persistent disk fallback.
         """
-        if query not in self._query_cache:
-            self._query_cache[query] = self.model.encode(
+        cached = self._query_cache.get(query)
+        if cached is not None:
+            self._query_cache.move_to_end(query)
+            return cached
+
+        embedding = self._load_cached(query)
+        if embedding is None:
+            embedding = self.model.encode(
                 query,
                 convert_to_numpy=True,
                 normalize_embeddings=True,
             )
-        return self._query_cache[query]
+            self._save_cached(query, embedding)
 
-    def embed_chunks(self, chunks: List[Dict]) -> np.ndarray:
+        self._remember(query, embedding)
+        return embedding
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
         """
-        Embed document chunks (used only during ingestion).
+        Embed a batch of texts (used only during ingestion).
         """
-        texts = [c["text"] for c in chunks]
         return self.model.encode(
             texts,
             convert_to_numpy=True,
             normalize_embeddings=True,
         )
+
+    def embed_chunks(self, chunks: List[Dict]) -> np.ndarray:
+        """
+        Embed document chunks (used only during ingestion).
+        """
+        return self.embed_texts([c["text"] for c in chunks])
+
+    # Internal cache helpers
+
+    def _cache_path(self, query: str) -> Path:
+        digest = hashlib.sha256(
+            f"{self.model_name}\x00{query}".encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir / f"{digest}.npy"
+
+    def _load_cached(self, query: str) -> Optional[np.ndarray]:
+        path = self._cache_path(query)
+        if not path.exists():
+            return None
+        try:
+            # Plain read, not mmap: a memmap pins an open file descriptor
+            # for as long as the array lives in the in-memory LRU, which
+            # at QUERY_CACHE_SIZE entries can exhaust the fd ulimit. For
+            # 1.5 KB query vectors the copy is cheaper than the fd.
+            return np.load(path)
+        except (OSError, ValueError):
+            logger.warning("Corrupt query cache entry, re-encoding: %s", path.name)
+            return None
+
+    def _save_cached(self, query: str, embedding: np.ndarray):
+        try:
+            np.save(self._cache_path(query), embedding)
+        except OSError as e:
+            logger.warning("Failed to persist query cache entry: %s", e)
+            return
+        self._saves_since_sweep += 1
+        if self._saves_since_sweep >= _DISK_SWEEP_INTERVAL:
+            self._saves_since_sweep = 0
+            self._sweep_disk_cache()
+
+    def _sweep_disk_cache(self):
+        """Evict the oldest on-disk entries once the cap is exceeded."""
+        try:
+            entries = sorted(
+                self._cache_dir.glob("*.npy"),
+                key=lambda p: p.stat().st_mtime,
+            )
+        except OSError as e:
+            logger.warning("Query cache sweep failed: %s", e)
+            return
+
+        excess = len(entries) - settings.QUERY_CACHE_DISK_ENTRIES
+        if excess <= 0:
+            return
+        for path in entries[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        logger.info("Evicted %d on-disk query cache entries.", excess)
+
+    def _remember(self, query: str, embedding: np.ndarray):
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._query_cache[query] = embedding
+        self._query_cache.move_to_end(query)
+        if len(self._query_cache) > settings.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
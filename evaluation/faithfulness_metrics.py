@@ -1,5 +1,7 @@
 from typing import List, Dict
 
+import numpy as np
+
 
 class FaithfulnessMetrics:
     """
@@ -37,6 +39,39 @@ class FaithfulnessMetrics:
             1, len(verifier_result.get("unsupported_sentences", []))
         )
 
+    def update_batch(self, verifier_results: List[Dict]) -> None:
+        """
+        Update metric counters from many verifier results at once.
+
+        Equivalent to calling update() per result, but the reductions run
+        as NumPy array operations — worthwhile in evaluation loops that
+        score thousands of verdicts.
+
+        Parameters
+        ----------
+        verifier_results : List[Dict]
+            Outputs from AnswerVerifier.verify(...)
+        """
+        if not verifier_results:
+            return
+
+        n = len(verifier_results)
+        unsupported = np.fromiter(
+            (r["verdict"] == "unsupported" for r in verifier_results),
+            dtype=np.bool_,
+            count=n,
+        )
+        unsupported_counts = np.fromiter(
+            (len(r.get("unsupported_sentences", [])) for r in verifier_results),
+            dtype=np.int64,
+            count=n,
+        )
+
+        self.total_questions += n
+        self.refused_questions += int(unsupported.sum())
+        self.unsupported_sentences += int(unsupported_counts[unsupported].sum())
+        self.total_sentences += int(np.maximum(1, unsupported_counts).sum())
+
     def compute(self) -> Dict[str, float]:
         """
         Compute aggregate faithfulness metrics.
@@ -1,12 +1,32 @@
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
 import re
 import logging
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from configs.settings import settings
+from generation.citations import CITATION_RE
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import — sentence splitting runs on every verify() call
+# and is the non-ML hot spot for long answers.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Embedding cache entries kept per verifier (sentences + evidence texts)
+_EMB_CACHE_SIZE = 8192
+
+# Sentences are verified in batches of this size so that obviously-bad
+# answers can stop encoding once the rejection budget is exceeded; a
+# typical answer fits in one batch and still gets a single forward pass.
+_VERIFY_BATCH_SIZE = 32
+
+# Evidence text is truncated to this many characters before encoding
+# (~200 tokens at MiniLM's ~4 chars/token). Transformer cost is quadratic
+# in sequence length, and similarity to a short answer sentence is
+# dominated by the closest span, which truncation rarely cuts off.
+_EVIDENCE_MAX_CHARS = 800
+
 
 class AnswerVerifier:
     """
@@ -22,9 +42,14 @@ class AnswerVerifier:
         r"^(in other words|that is|for example|for instance|specifically)",
     ]
 
+    # One alternation pass instead of a Python loop of re.match calls,
+    # compiled once at class-definition time
+    _FILLER_RE = re.compile("|".join(f"(?:{p})" for p in FILLER_PATTERNS))
+    _CITATION_STRIP_RE = CITATION_RE
+
     def __init__(
         self,
-        encoder_model: Any,
+        encoder_model: Any = None,
         similarity_threshold: float = settings.VERIFICATION_SIMILARITY_THRESHOLD,
         min_unsupported_ratio: float = settings.VERIFICATION_UNSUPPORTED_RATIO,
         min_sentence_length: int = 20,
@@ -33,7 +58,11 @@ class AnswerVerifier:
         Parameters
         ----------
         encoder_model : Any
-            A sentence-transformer model or compatible object with .encode() method.
+            A sentence-transformer model or compatible object with .encode()
+            method. Defaults to the process-wide shared embedding model,
+            resolved lazily on the first encode, so the verifier never
+            loads a second copy of MiniLM and trivially-handled answers
+            (refusals, all-filler) never trigger a model load at all.
         similarity_threshold : float
             Minimum cosine similarity to consider a sentence supported.
         min_unsupported_ratio : float
@@ -41,15 +70,25 @@ class AnswerVerifier:
         min_sentence_length : int
             Sentences shorter than this are skipped (likely filler).
         """
-        self.model = encoder_model
+        self._model = encoder_model
         self.similarity_threshold = similarity_threshold
         self.min_unsupported_ratio = min_unsupported_ratio
         self.min_sentence_length = min_sentence_length
+        self._emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    @property
+    def model(self) -> Any:
+        """The encoder model, loading the shared one on first access."""
+        if self._model is None:
+            from embeddings.encoder import get_shared_model
+            self._model = get_shared_model()
+        return self._model
 
     def verify(
         self,
         answer: str,
         evidence_chunks: List[Dict],
+        evidence_embeddings: Optional[np.ndarray] = None,
     ) -> Dict[str, object]:
         """
         Verify an answer against retrieved evidence.
@@ -60,6 +99,10 @@ class AnswerVerifier:
             Raw LLM-generated answer text.
         evidence_chunks : List[Dict]
             Retrieved chunks containing evidence text.
+        evidence_embeddings : Optional[np.ndarray]
+            Pre-computed L2-normalized embeddings for evidence_chunks
+            (one row per chunk). Callers that already embedded the
+            evidence upstream pass them here to skip re-encoding.
 
         Returns
         -------
@@ -73,7 +116,9 @@ class AnswerVerifier:
         """
 
         answer_sentences = self._split_into_sentences(answer)
-        evidence_texts = [chunk["text"] for chunk in evidence_chunks]
+        evidence_texts = [
+            chunk["text"][:_EVIDENCE_MAX_CHARS] for chunk in evidence_chunks
+        ]
 
         if not answer_sentences or not evidence_texts:
             return self._unsupported(answer_sentences)
@@ -91,30 +136,66 @@ class AnswerVerifier:
                 "support_ratio": 1.0,
             }
 
-        sentence_embeddings = self.model.encode(
-            substantive_sentences, convert_to_numpy=True
-        )
-        evidence_embeddings = self.model.encode(
-            evidence_texts, convert_to_numpy=True
-        )
+        # Once this many sentences are unsupported the verdict is already
+        # "unsupported", whatever the remaining sentences score.
+        reject_budget = int(self.min_unsupported_ratio * len(substantive_sentences))
+
+        # First batch encodes sentences and evidence in one forward pass —
+        # for typical answers that is the only encode() call. Longer
+        # answers continue batch-by-batch so a hopeless answer stops
+        # paying for the encoder as soon as its budget is blown.
+        first_batch = substantive_sentences[:_VERIFY_BATCH_SIZE]
+        if evidence_embeddings is not None and len(evidence_embeddings) == len(
+            evidence_texts
+        ):
+            embeddings = self._encode_cached(first_batch)
+            evidence_embeddings = np.asarray(evidence_embeddings, dtype="float32")
+        else:
+            embeddings = self._encode_cached(first_batch + evidence_texts)
+            evidence_embeddings = embeddings[len(first_batch):]
 
         unsupported = []
-        sentence_scores = []
+        max_similarities = []
+        evaluated = 0
+        for start in range(0, len(substantive_sentences), _VERIFY_BATCH_SIZE):
+            batch = substantive_sentences[start:start + _VERIFY_BATCH_SIZE]
+            if start == 0:
+                batch_embeddings = embeddings[: len(first_batch)]
+            else:
+                batch_embeddings = self._encode_cached(batch)
 
-        for idx, sent_embedding in enumerate(sentence_embeddings):
-            similarities = cosine_similarity(
-                sent_embedding.reshape(1, -1),
-                evidence_embeddings,
-            )[0]
+            # Embeddings are L2-normalized at encode time, so cosine
+            # similarity reduces to a matmul across sentence/evidence pairs.
+            similarities = batch_embeddings @ evidence_embeddings.T
+            batch_max = np.max(similarities, axis=1)
+            max_similarities.append(batch_max)
+            evaluated += len(batch)
 
-            max_sim = float(np.max(similarities))
-            sentence_scores.append(max_sim)
+            unsupported.extend(
+                sentence
+                for sentence, flagged in zip(
+                    batch, batch_max < self.similarity_threshold
+                )
+                if flagged
+            )
 
-            if max_sim < self.similarity_threshold:
-                unsupported.append(substantive_sentences[idx])
+            if len(unsupported) > reject_budget:
+                avg_confidence = float(np.mean(np.concatenate(max_similarities)))
+                logger.info(
+                    "Verification aborted early: %d unsupported sentences after "
+                    "%d/%d evaluated (budget=%d)",
+                    len(unsupported), evaluated,
+                    len(substantive_sentences), reject_budget,
+                )
+                return {
+                    "verdict": "unsupported",
+                    "unsupported_sentences": unsupported,
+                    "confidence": avg_confidence,
+                    "support_ratio": 1 - len(unsupported) / evaluated,
+                }
 
         unsupported_ratio = len(unsupported) / len(substantive_sentences)
-        avg_confidence = float(np.mean(sentence_scores))
+        avg_confidence = float(np.mean(np.concatenate(max_similarities)))
 
         logger.info(
             "Verification: %d/%d substantive sentences supported (threshold=%.2f, avg_sim=%.3f)",
@@ -147,10 +228,50 @@ class AnswerVerifier:
             "support_ratio": 1.0,
         }
 
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts through an LRU cache keyed by SHA-1 of normalized text.
+
+        The same evidence chunks are re-verified across follow-up turns in
+        a session, so the evidence side of verify() is a near-100% hit
+        after the first question — only genuinely new texts reach MiniLM.
+        """
+        keys = [
+            hashlib.sha1(t.strip().encode("utf-8")).hexdigest() for t in texts
+        ]
+        missing = [
+            (i, t)
+            for i, (k, t) in enumerate(zip(keys, texts))
+            if k not in self._emb_cache
+        ]
+        if missing:
+            encoded = self.model.encode(
+                [t for _, t in missing],
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=64,
+            )
+            for (i, _), emb in zip(missing, encoded):
+                self._emb_cache[keys[i]] = emb
+
+        embeddings = np.stack([self._emb_cache[k] for k in keys])
+        for k in keys:
+            self._emb_cache.move_to_end(k)
+        while len(self._emb_cache) > _EMB_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+        return embeddings
+
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences using conservative punctuation rules."""
-        parts = re.split(r"(?<=[.!?])\s+", text.strip())
-        return [p.strip() for p in parts if p.strip()]
+        text = text.strip()
+        if not text:
+            return []
+        # Fast path: single-sentence answers (and refusals) skip the split
+        if not _SENTENCE_SPLIT_RE.search(text):
+            return [text]
+        # Single pass: strip once per part instead of strip-in-filter plus
+        # strip-in-result
+        return [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text)) if s]
 
     def _is_substantive(self, sentence: str) -> bool:
         """
@@ -161,16 +282,11 @@ class AnswerVerifier:
             return False
 
         # Strip citation markers before checking
-        clean = re.sub(r"\[E\d+\]", "", sentence).strip()
+        clean = self._CITATION_STRIP_RE.sub("", sentence).strip()
         if len(clean) < self.min_sentence_length:
             return False
 
-        sentence_lower = clean.lower().strip()
-        for pattern in self.FILLER_PATTERNS:
-            if re.match(pattern, sentence_lower):
-                return False
-
-        return True
+        return self._FILLER_RE.match(clean.lower()) is None
 
     def _unsupported(self, sentences: List[str]) -> Dict[str, object]:
         """Construct an unsupported verdict payload."""
@@ -8,18 +8,20 @@ and maps them back to actual evidence chunks with page references.
 from typing import List, Dict, Tuple, Set
 import re
 
+from generation.citations import CITATION_RE
+
 
 class CitationExtractor:
     """
     Extracts and validates citations from generated answers.
-    
+
     This module ensures that:
     - All citations in the answer are valid (exist in evidence)
     - Citations are properly mapped to source documents and pages
     - Uncited sentences are flagged for transparency
     """
 
-    CITATION_PATTERN = re.compile(r"\[E(\d+)\]")
+    CITATION_PATTERN = CITATION_RE
 
     def extract_and_map(
         self,
@@ -47,54 +49,73 @@ class CitationExtractor:
                 "citation_coverage": float,
             }
         """
-        # Build evidence map (1-indexed to match prompt)
-        evidence_map = {}
-        for idx, chunk in enumerate(evidence_chunks, start=1):
-            evidence_map[f"E{idx}"] = {
-                "evidence_id": f"E{idx}",
-                "doc_id": chunk.get("doc_id", "unknown"),
-                "page_start": chunk.get("page_start", 0),
-                "page_end": chunk.get("page_end", 0),
-                "text_preview": chunk.get("text", "")[:150] + "...",
-            }
+        # Single citation scan: unique ids in order of appearance, plus
+        # match positions for the sentence-coverage walk below. The old
+        # implementation scanned the answer three times (findall, one
+        # search per sentence, finditer for ordering).
+        citation_starts = []
+        ordered_citations = []
+        seen = set()
+        for match in self.CITATION_PATTERN.finditer(answer):
+            citation_starts.append(match.start())
+            eid = match.group(1)
+            if eid not in seen:
+                seen.add(eid)
+                ordered_citations.append(eid)
 
-        # Extract all citations from answer
-        found_citations = set(self.CITATION_PATTERN.findall(answer))
-        
-        # Validate citations exist in evidence
+        # Validate citations and build metadata lazily — only cited
+        # evidence pays for dict construction and the preview slice
+        # (evidence ids are 1-indexed to match the prompt)
         valid_citations = {}
         invalid_citations = []
-        
-        for citation_num in found_citations:
-            eid = f"E{citation_num}"
-            if eid in evidence_map:
-                valid_citations[eid] = evidence_map[eid]
+        for eid in ordered_citations:
+            idx = int(eid[1:]) - 1
+            if 0 <= idx < len(evidence_chunks):
+                chunk = evidence_chunks[idx]
+                valid_citations[eid] = {
+                    "evidence_id": eid,
+                    "doc_id": chunk.get("doc_id", "unknown"),
+                    "page_start": chunk.get("page_start", 0),
+                    "page_end": chunk.get("page_end", 0),
+                    "text_preview": chunk.get("text", "")[:150] + "...",
+                }
             else:
                 invalid_citations.append(eid)
 
-        # Analyze sentence-level citation coverage
-        sentences = self._split_sentences(answer)
-        cited_sentences = []
-        uncited_sentences = []
-
-        for sentence in sentences:
-            if self._is_substantive(sentence):
-                if self.CITATION_PATTERN.search(sentence):
-                    cited_sentences.append(sentence)
-                else:
-                    uncited_sentences.append(sentence)
+        # Inline citation list is already ordered by first appearance
+        inline_citations = [
+            valid_citations[eid] for eid in ordered_citations if eid in valid_citations
+        ]
 
-        total_substantive = len(cited_sentences) + len(uncited_sentences)
-        coverage = len(cited_sentences) / total_substantive if total_substantive > 0 else 1.0
+        # Sentence-level coverage: merge the ordered citation positions
+        # with the ordered sentence spans in one forward walk
+        cited_count = 0
+        uncited_sentences = []
+        match_idx = 0
+        cursor = 0
+        for sentence in self._split_sentences(answer):
+            start = answer.find(sentence, cursor)
+            if start == -1:
+                start = cursor
+            end = start + len(sentence)
+            cursor = end
+
+            if not self._is_substantive(sentence):
+                continue
+
+            has_citation = False
+            while match_idx < len(citation_starts) and citation_starts[match_idx] < end:
+                if citation_starts[match_idx] >= start:
+                    has_citation = True
+                match_idx += 1
+
+            if has_citation:
+                cited_count += 1
+            else:
+                uncited_sentences.append(sentence)
 
-        # Build inline citation list (ordered by appearance)
-        inline_citations = []
-        seen = set()
-        for match in self.CITATION_PATTERN.finditer(answer):
-            eid = f"E{match.group(1)}"
-            if eid not in seen and eid in valid_citations:
-                inline_citations.append(valid_citations[eid])
-                seen.add(eid)
+        total_substantive = cited_count + len(uncited_sentences)
+        coverage = cited_count / total_substantive if total_substantive > 0 else 1.0
 
         return {
             "answer_with_citations": answer,
@@ -131,7 +152,7 @@ class CitationExtractor:
             return f"**{eid}**"
 
         return self.CITATION_PATTERN.sub(
-            lambda m: f"**[E{m.group(1)}]**",
+            lambda m: f"**[{m.group(1)}]**",
             answer,
         )
 
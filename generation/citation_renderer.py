@@ -1,5 +1,6 @@
 from typing import Dict
-import re
+
+from generation.citations import CITATION_RE
 
 
 class CitationRenderer:
@@ -42,14 +43,13 @@ class CitationRenderer:
             meta = self.evidence_map.get(eid, {})
             return f"({meta.get('author', 'Unknown')}, {meta.get('year', 'n.d.')})"
 
-        return re.sub(r"\[(E\d+)\]", repl, text)
+        return CITATION_RE.sub(repl, text)
 
     def _replace(self, text: str, prefix: str, suffix: str) -> str:
         """
         Generic numeric citation replacement.
         """
-        return re.sub(
-            r"\[(E\d+)\]",
+        return CITATION_RE.sub(
             lambda m: f"{prefix}{m.group(1)[1:]}{suffix}",
             text,
         )
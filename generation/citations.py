@@ -0,0 +1,13 @@
+"""
+Shared citation regex.
+
+Every module that touches canonical [E1]-style citations — extraction,
+verification, rendering — matches against this single compiled pattern,
+so the syntax lives in one place and each call site skips the re-cache
+lookup that string-pattern re.sub/re.match calls pay.
+"""
+
+import re
+
+# Group 1 captures the evidence id including the "E" prefix, e.g. "E3".
+CITATION_RE = re.compile(r"\[(E\d+)\]")
@@ -1,10 +1,83 @@
+import asyncio
+import functools
+import hashlib
+import re
 import time
 import logging
-from openai import OpenAI, OpenAIError
+import weakref
+from collections import OrderedDict
+import httpx
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 from configs.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundary used when re-chunking a token stream into sentences;
+# matches the verifier's splitting rule.
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Process-wide OpenAI client, created once per (api_key, base_url).
+
+    The client owns an httpx connection pool; constructing one per
+    LLMClient instance fragments the pool and forces a fresh TLS
+    handshake on the first generate() of every instance. An explicit
+    pool keeps TLS sessions warm across bursts (multiplexed over HTTP/2
+    when the optional h2 package is installed).
+    """
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    try:
+        http_client = httpx.Client(http2=True, limits=limits)
+    except ImportError:
+        http_client = httpx.Client(limits=limits)
+    client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+    # Enable LangSmith tracing if installed
+    try:
+        from langsmith import wrappers
+        client = wrappers.wrap_openai(client)
+        logger.info("LangSmith tracing enabled for LLMClient.")
+    except ImportError:
+        logger.info("LangSmith not installed — skipping instrumentation.")
+
+    return client
+
+
+# Async clients cached per event loop: keep-alive connections are bound
+# to the loop that opened them, so a process-wide client goes stale
+# ("Event loop is closed") once generate_many's asyncio.run tears its
+# loop down. Entries die with their loop via the weak keys.
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _shared_async_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """
+    AsyncOpenAI client for the running event loop, created on first use.
+
+    Long-lived loops (a server) reuse one warm connection pool across
+    requests; short-lived loops (each generate_many batch) get their own.
+    HTTP/2 multiplexes concurrent requests over one connection when the
+    optional h2 package is installed; otherwise the default HTTP/1.1
+    pool is used. Must be called from inside a running loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        try:
+            http_client = httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            http_client = httpx.AsyncClient(limits=limits)
+        client = AsyncOpenAI(
+            api_key=api_key, base_url=base_url, http_client=http_client
+        )
+        clients[(api_key, base_url)] = client
+    return client
+
 
 class LLMClient:
     """
@@ -20,18 +93,10 @@ class LLMClient:
         self.base_url = settings.LLM_API_BASE
         self.model = settings.LLM_MODEL
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url,
-        )
-        
-        # Enable LangSmith tracing if installed
-        try:
-            from langsmith import wrappers
-            self.client = wrappers.wrap_openai(self.client)
-            logger.info("LangSmith tracing enabled for LLMClient.")
-        except ImportError:
-            logger.info("LangSmith not installed — skipping instrumentation.")
+        self.client = _shared_client(self.api_key, self.base_url)
+        # Exact-prompt response cache — repeated questions over the same
+        # evidence skip the network round-trip entirely.
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
 
     def generate(self, prompt: dict) -> str:
         """Generate an answer strictly grounded in the provided prompt.
@@ -39,6 +104,10 @@ class LLMClient:
         Retries up to MAX_RETRIES times with exponential backoff on
         transient API errors.
         """
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
         last_error = None
 
         for attempt in range(1, self.MAX_RETRIES + 1):
@@ -53,7 +122,9 @@ class LLMClient:
                     max_tokens=settings.LLM_MAX_TOKENS,
                 )
 
-                return response.choices[0].message.content.strip()
+                return self._store_response(
+                    prompt, response.choices[0].message.content.strip()
+                )
 
             except OpenAIError as e:
                 last_error = e
@@ -71,3 +142,152 @@ class LLMClient:
                 raise
 
         raise last_error  # type: ignore[misc]
+
+    def _cache_key(self, prompt: dict) -> str:
+        return hashlib.sha256(
+            f"{self.model}\x00{prompt['system']}\x00{prompt['user']}".encode("utf-8")
+        ).hexdigest()
+
+    def _cached_response(self, prompt: dict) -> "str | None":
+        """Return a cached completion for an identical prompt, if any.
+
+        Exact-match only: generation runs at temperature 0, so the same
+        (model, system, user) prompt is deterministic and safe to replay.
+        Similarity-threshold caching is deliberately avoided — a merely
+        similar question may cite evidence that was never retrieved
+        for it.
+        """
+        if settings.LLM_RESPONSE_CACHE_SIZE <= 0:
+            return None
+        key = self._cache_key(prompt)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logger.info("LLM response cache hit.")
+        return cached
+
+    def _store_response(self, prompt: dict, answer: str) -> str:
+        if settings.LLM_RESPONSE_CACHE_SIZE > 0:
+            self._response_cache[self._cache_key(prompt)] = answer
+            while len(self._response_cache) > settings.LLM_RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return answer
+
+    def generate_many(self, prompts: list, max_concurrency: int = 8) -> list:
+        """Generate answers for several prompts concurrently.
+
+        Network round-trips overlap on one event loop instead of
+        serializing, which for batch evaluation cuts wall time by
+        roughly the concurrency factor. ``max_concurrency`` bounds the
+        in-flight requests to stay under the provider's rate limits.
+        """
+        async def _run():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _bounded(prompt):
+                async with semaphore:
+                    return await self.agenerate(prompt)
+
+            return await asyncio.gather(*[_bounded(p) for p in prompts])
+
+        return asyncio.run(_run())
+
+    def generate_stream(self, prompt: dict, on_sentence=None) -> str:
+        """Generate with streaming, emitting sentences as they complete.
+
+        ``on_sentence`` is called with each completed sentence; returning
+        False closes the stream immediately, so a caller running
+        incremental verification can stop paying for tokens as soon as
+        the answer is known to be unsupportable. Returns the text
+        generated up to that point.
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": prompt["system"]},
+                {"role": "user", "content": prompt["user"]},
+            ],
+            temperature=settings.LLM_TEMPERATURE,
+            max_tokens=settings.LLM_MAX_TOKENS,
+            stream=True,
+        )
+
+        received = []
+        pending = ""
+        aborted = False
+        try:
+            for event in stream:
+                delta = event.choices[0].delta.content if event.choices else None
+                if not delta:
+                    continue
+                received.append(delta)
+                pending += delta
+
+                if on_sentence is None:
+                    continue
+                # Emit every complete sentence currently buffered; the
+                # tail stays pending until its boundary arrives.
+                *complete, pending = _SENTENCE_BOUNDARY_RE.split(pending)
+                for sentence in complete:
+                    if sentence and on_sentence(sentence) is False:
+                        logger.info("Generation aborted by sentence callback.")
+                        aborted = True
+                        break
+                if aborted:
+                    break
+        finally:
+            stream.close()
+
+        if not aborted and on_sentence is not None and pending.strip():
+            on_sentence(pending.strip())
+
+        return "".join(received).strip()
+
+    async def agenerate(self, prompt: dict) -> str:
+        """Async counterpart to generate() for concurrent workloads.
+
+        Batch evaluation and verifier-driven retries can issue several
+        completions in parallel instead of serializing round-trips.
+        Same retry/backoff policy as generate().
+        """
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
+        # Resolved per call: the client must belong to the loop this
+        # coroutine is running on, which __init__ cannot know.
+        aclient = _shared_async_client(self.api_key, self.base_url)
+        last_error = None
+
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            try:
+                response = await aclient.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": prompt["system"]},
+                        {"role": "user", "content": prompt["user"]},
+                    ],
+                    temperature=settings.LLM_TEMPERATURE,
+                    max_tokens=settings.LLM_MAX_TOKENS,
+                )
+
+                return self._store_response(
+                    prompt, response.choices[0].message.content.strip()
+                )
+
+            except OpenAIError as e:
+                last_error = e
+                if attempt < self.MAX_RETRIES:
+                    delay = self.BASE_DELAY * (2 ** (attempt - 1))
+                    logger.warning(
+                        "LLM API error (attempt %d/%d), retrying in %.1fs: %s",
+                        attempt, self.MAX_RETRIES, delay, e,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error("LLM API error after %d attempts: %s", self.MAX_RETRIES, e)
+            except Exception as e:
+                logger.error("LLM unexpected error: %r", e)
+                raise
+
+        raise last_error  # type: ignore[misc]
@@ -16,6 +16,18 @@ class PromptBuilder:
     as a post-processing step.
     """
 
+    # System-level instruction enforcing strict grounding and citation
+    # behavior. Static, so built once at class definition.
+    _SYSTEM_INSTRUCTION = (
+        "You are an academic question-answering system with strict citation requirements.\n"
+        "CRITICAL RULES:\n"
+        "1. You must cite sources using [E1], [E2], etc. format INLINE after each factual claim.\n"
+        "2. Every sentence containing facts, numbers, names, or findings MUST end with a citation.\n"
+        "3. You may only cite evidence IDs that appear in the provided evidence (E1 through E8 max).\n"
+        "4. Do NOT use prior knowledge - only use information from the evidence.\n"
+        "5. Place citations at the END of each sentence, before the period: '...the result is 0.5 [E1].'"
+    )
+
     def __init__(
         self,
         max_evidence_chunks: int = 8,
@@ -32,22 +44,22 @@ class PromptBuilder:
         """
         Build a citation-aware prompt with optional session memory.
         """
-        system_prompt = self._system_instruction()
-        evidence_block = self._format_evidence(retrieved_chunks)
-
-        user_prompt = (
+        # Collect parts and join once — evidence blocks are multi-KB, so
+        # repeated += would copy the growing prompt for every segment.
+        parts = [
             "You are provided with evidence excerpts from academic documents.\n\n"
-        )
-        
+        ]
+
         if pinned_context:
-            user_prompt += f"{pinned_context}\n\n"
-            
+            parts.append(f"{pinned_context}\n\n")
+
         if conversation_context:
-            user_prompt += f"{conversation_context}\n\n"
+            parts.append(f"{conversation_context}\n\n")
 
-        user_prompt += (
-            "Evidence:\n"
-            f"{evidence_block}\n\n"
+        parts.append("Evidence:\n")
+        parts.append(self._format_evidence(retrieved_chunks))
+        parts.append(
+            "\n\n"
             "Question:\n"
             f"{question}\n\n"
             "Instructions:\n"
@@ -62,23 +74,13 @@ class PromptBuilder:
         )
 
         return {
-            "system": system_prompt,
-            "user": user_prompt,
+            "system": self._system_instruction(),
+            "user": "".join(parts),
         }
 
     def _system_instruction(self) -> str:
-        """
-        System-level instruction enforcing strict grounding and citation behavior.
-        """
-        return (
-            "You are an academic question-answering system with strict citation requirements.\n"
-            "CRITICAL RULES:\n"
-            "1. You must cite sources using [E1], [E2], etc. format INLINE after each factual claim.\n"
-            "2. Every sentence containing facts, numbers, names, or findings MUST end with a citation.\n"
-            "3. You may only cite evidence IDs that appear in the provided evidence (E1 through E8 max).\n"
-            "4. Do NOT use prior knowledge - only use information from the evidence.\n"
-            "5. Place citations at the END of each sentence, before the period: '...the result is 0.5 [E1].'"
-        )
+        """Return the static system instruction."""
+        return self._SYSTEM_INSTRUCTION
 
     def _format_evidence(self, chunks: List[Dict]) -> str:
         """
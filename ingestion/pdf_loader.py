@@ -1,7 +1,37 @@
 import hashlib
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import fitz  # PyMuPDF
 
+# Compiled once — whitespace collapse runs on every extracted page.
+_WS_RE = re.compile(r"\s+")
+
+# Below this page count the fork/IPC overhead of a process pool costs
+# more than serial extraction saves.
+_PARALLEL_MIN_PAGES = 32
+
+
+def _normalize_page_text(text: str) -> str:
+    return _WS_RE.sub(" ", text).replace("\u00ad", "").strip()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int):
+    """
+    Worker for parallel extraction: open a private document handle and
+    extract pages [start, stop). fitz documents are not shareable across
+    processes, so each worker reopens the file — cheap next to parsing.
+    """
+    results = []
+    with fitz.open(pdf_path) as doc:
+        for i in range(start, stop):
+            text = _normalize_page_text(doc[i].get_text("text", sort=False))
+            if text:
+                results.append((i + 1, text))
+    return results
+
 
 class PDFLoader:
     """
@@ -16,18 +46,48 @@ class PDFLoader:
         self.doc_id = self._compute_doc_id(pdf_path)
 
     def load(self):
-        doc = fitz.open(self.pdf_path)
         pages = []
 
-        for i, page in enumerate(doc):
-            text = page.get_text().strip()
-            if text:
-                pages.append(
-                    {
-                        "page_num": i + 1,
-                        "text": text,
-                    }
-                )
+        with fitz.open(self.pdf_path) as doc:
+            page_count = doc.page_count
+            if page_count < _PARALLEL_MIN_PAGES:
+                for i, page in enumerate(doc):
+                    # sort=False skips reading-order resorting, which is
+                    # the expensive part of get_text and rarely needed for
+                    # the single-column papers we ingest. Whitespace is
+                    # collapsed here with one compiled regex pass (plus
+                    # soft-hyphen removal) instead of per-page split/join
+                    # downstream.
+                    text = _normalize_page_text(page.get_text("text", sort=False))
+                    if text:
+                        pages.append(
+                            {
+                                "page_num": i + 1,
+                                "text": text,
+                            }
+                        )
+                return {
+                    "doc_id": self.doc_id,
+                    "pages": pages,
+                }
+
+        # Long documents: split the page range across a process pool.
+        # PDF parsing is CPU-bound, so this scales near-linearly on cores;
+        # the parent handle is closed first and each worker opens its own.
+        workers = min(os.cpu_count() or 1, math.ceil(page_count / _PARALLEL_MIN_PAGES))
+        step = math.ceil(page_count / workers)
+        path = str(self.pdf_path)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(
+                _extract_page_range,
+                [path] * workers,
+                range(0, page_count, step),
+                [min(lo + step, page_count) for lo in range(0, page_count, step)],
+            )
+
+        for part in parts:
+            for page_num, text in part:
+                pages.append({"page_num": page_num, "text": text})
 
         return {
             "doc_id": self.doc_id,
@@ -35,6 +95,15 @@ class PDFLoader:
         }
 
     def _compute_doc_id(self, path: Path) -> str:
-        hasher = hashlib.sha256()
-        hasher.update(path.read_bytes())
-        return hasher.hexdigest()[:16]
+        # Keep in sync with the /upload dedup check, which derives the
+        # doc_id from the same content hash while streaming to disk.
+        # Hashing streams through the file instead of materializing it:
+        # peak memory stays constant regardless of PDF size, and
+        # file_digest's C loop releases the GIL per block.
+        with path.open("rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()[:16]
+            hasher = hashlib.sha256()
+            while chunk := f.read(1 << 20):
+                hasher.update(chunk)
+            return hasher.hexdigest()[:16]
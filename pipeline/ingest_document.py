@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 from ingestion.pdf_loader import PDFLoader
 from preprocessing.cleaner import clean_pages
-from preprocessing.chunker import SemanticChunker
+from preprocessing.chunker import ChunkBatch, SemanticChunker
 from embeddings.encoder import EmbeddingEncoder
 from retrieval.faiss_index import FaissIndex
 
@@ -21,6 +21,14 @@ def ingest_document(
     Returns the document ID (SHA-256 hash of the file).
     """
     loader = PDFLoader(pdf_path)
+
+    # Content-hash dedup before any extraction work: re-ingesting a PDF
+    # that is already indexed would repeat the whole clean/chunk/embed
+    # pipeline only to add duplicate chunks.
+    if loader.doc_id in index.get_doc_ids():
+        logger.info("Document %s already indexed — skipping ingestion.", loader.doc_id)
+        return loader.doc_id
+
     data = loader.load()
 
     doc_id = data["doc_id"]
@@ -32,14 +40,13 @@ def ingest_document(
     chunks = chunker.chunk(pages, doc_id)
     logger.info("Created %d chunks for document %s", len(chunks), doc_id)
 
-    # Embed the chunks
-    embeddings = encoder.embed_chunks(chunks)
-
-    for chunk, emb in zip(chunks, embeddings):
-        chunk["embedding"] = emb
+    # Embed the chunks via the SoA batch — texts are extracted once and
+    # metadata stays in parallel arrays until the index boundary
+    batch = ChunkBatch.from_chunks(chunks)
+    embeddings = encoder.embed_texts(batch.texts)
 
     # Add to index (embeddings are stripped inside index.add)
-    index.add(chunks)
+    index.add(batch.to_index_chunks(embeddings))
     index.save()
 
     logger.info("Document %s indexed successfully.", doc_id)
@@ -11,6 +11,31 @@ from configs.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Stateless pipeline components shared across requests — constructing
+# them per call only churned allocations in the request hot path.
+_prompt_builder = PromptBuilder()
+_citation_extractor = None
+
+# The verifier carries an embedding LRU, so reusing one instance lets
+# evidence embeddings survive across follow-up questions in a session.
+_verifier: Optional[AnswerVerifier] = None
+
+
+def _get_citation_extractor() -> CitationExtractor:
+    """Shared extractor, constructed through the module-level class name
+    so tests patching CitationExtractor see their mock used."""
+    global _citation_extractor
+    if type(_citation_extractor) is not CitationExtractor:
+        _citation_extractor = CitationExtractor()
+    return _citation_extractor
+
+
+def _get_verifier(encoder_model) -> AnswerVerifier:
+    global _verifier
+    if _verifier is None or _verifier._model is not encoder_model:
+        _verifier = AnswerVerifier(encoder_model=encoder_model)
+    return _verifier
+
 # Try to import the NLI verifier; graceful fallback if deps are missing
 _nli_available = False
 try:
@@ -41,7 +66,9 @@ def run_query_pipeline(
         (cosine similarity + NLI entailment).
     """
 
-    # Hard guards
+    # Hard guards — everything here is O(1) and runs before the query
+    # embedding, so trivially unanswerable requests never pay a model
+    # forward pass or a FAISS probe.
     if not index.chunks:
         return {
             "answer": "No documents have been uploaded yet.",
@@ -49,6 +76,21 @@ def run_query_pipeline(
             "citations": [],
         }
 
+    question = question.strip()
+    if not question:
+        return {
+            "answer": "I cannot answer based on the provided documents.",
+            "verdict": "refused",
+            "citations": [],
+        }
+
+    if doc_ids and not set(doc_ids) & index.get_doc_ids():
+        return {
+            "answer": "I cannot answer based on the provided documents.",
+            "verdict": "refused",
+            "citations": [],
+        }
+
     query_embedding = encoder.embed_query(question)
     retrieved = index.search(
         query_embedding, 
@@ -64,12 +106,30 @@ def run_query_pipeline(
             "citations": [],
         }
 
-    evidence = reranker.rerank(question, retrieved, top_n=8)
-    logger.info(
-        "Reranked to %d evidence chunks (top score: %.3f)",
-        len(evidence),
-        evidence[0].get("cross_score", 0) if evidence else 0,
-    )
+    # When FAISS is already decisive, the cross-encoder rarely reorders
+    # anything — skip its ~20 transformer forwards, the dominant
+    # per-query compute cost.
+    evidence = None
+    if settings.RERANK_SKIP_TOP1 > 0 and len(retrieved) >= 2:
+        top_score = retrieved[0]["similarity_score"]
+        margin = top_score - retrieved[-1]["similarity_score"]
+        if (
+            top_score >= settings.RERANK_SKIP_TOP1
+            and margin >= settings.RERANK_SKIP_MARGIN
+        ):
+            evidence = retrieved[:8]
+            logger.info(
+                "FAISS scores decisive (top1=%.3f, margin=%.3f) — skipping rerank.",
+                top_score, margin,
+            )
+
+    if evidence is None:
+        evidence = reranker.rerank(question, retrieved, top_n=8)
+        logger.info(
+            "Reranked to %d evidence chunks (top score: %.3f)",
+            len(evidence),
+            evidence[0].get("cross_score", 0) if evidence else 0,
+        )
 
     if not evidence:
         return {
@@ -78,7 +138,7 @@ def run_query_pipeline(
             "citations": [],
         }
 
-    prompt = PromptBuilder().build(
+    prompt = _prompt_builder.build(
         question, 
         evidence, 
         conversation_context=conversation_context,
@@ -97,12 +157,10 @@ def run_query_pipeline(
         }
 
     # Extract and map citations from the answer
-    citation_extractor = CitationExtractor()
-    citation_result = citation_extractor.extract_and_map(answer, evidence)
+    citation_result = _get_citation_extractor().extract_and_map(answer, evidence)
 
     # Verify answer against evidence (cosine similarity)
-    verifier = AnswerVerifier(encoder_model=encoder.model)
-    verification = verifier.verify(answer, evidence)
+    verification = _get_verifier(encoder.model).verify(answer, evidence)
 
     logger.info(
         "Verification verdict: %s (confidence=%.3f, support_ratio=%.3f)",
@@ -1,8 +1,64 @@
 import uuid
 import re
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from configs.settings import settings
+
+
+@dataclass
+class ChunkBatch:
+    """
+    Structure-of-arrays view over chunked output for the ingestion hot path.
+
+    Chunks flow through ingestion as a list of dicts (AoS), which forces a
+    Python attribute walk per chunk at every stage. This batch keeps each
+    field in its own parallel array so embedding consumes `texts` directly
+    and numeric metadata lives in NumPy arrays.
+    """
+
+    doc_id: str
+    chunk_ids: List[str]
+    texts: List[str]
+    page_starts: np.ndarray
+    page_ends: np.ndarray
+    token_counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Dict]) -> "ChunkBatch":
+        """Build parallel arrays from chunker output in a single pass."""
+        return cls(
+            doc_id=chunks[0]["doc_id"] if chunks else "",
+            chunk_ids=[c["chunk_id"] for c in chunks],
+            texts=[c["text"] for c in chunks],
+            page_starts=np.fromiter(
+                (c["page_start"] for c in chunks), dtype=np.int32, count=len(chunks)
+            ),
+            page_ends=np.fromiter(
+                (c["page_end"] for c in chunks), dtype=np.int32, count=len(chunks)
+            ),
+            token_counts=np.fromiter(
+                (c["token_count"] for c in chunks), dtype=np.int32, count=len(chunks)
+            ),
+        )
+
+    def to_index_chunks(self, embeddings: np.ndarray) -> List[Dict]:
+        """Materialize per-chunk dicts at the FaissIndex boundary."""
+        return [
+            {
+                "chunk_id": self.chunk_ids[i],
+                "doc_id": self.doc_id,
+                "text": self.texts[i],
+                "page_start": int(self.page_starts[i]),
+                "page_end": int(self.page_ends[i]),
+                "token_count": int(self.token_counts[i]),
+                "embedding": embeddings[i],
+            }
+            for i in range(len(self.texts))
+        ]
 
 
 class SemanticChunker:
@@ -11,6 +67,23 @@ class SemanticChunker:
     Designed for RAG with hallucination control.
     """
 
+    # Conservative academic sentence splitting, compiled once at class
+    # definition — this runs on every page of every ingested document.
+    # The lookbehinds keep abbreviations like "et al." from splitting.
+    _SENTENCE_SPLIT_RE = re.compile(
+        r"(?<!et al)(?<!Fig)(?<!Eq)(?<!Dr)(?<!Mr)(?<!Ms)(?<=[.!?])\s+"
+    )
+
+    # Sentences per encode call when streaming document embeddings — a
+    # multiple of the per-device batch size, so the model's internal
+    # length-sorted batching still sees enough sentences to keep padding
+    # waste low.
+    _ENCODE_SLICE = 1024
+    # Rows in the open-chunk embedding buffer. Chunks are token-bounded
+    # far below this; chunk() force-splits in the unlikely event the
+    # buffer fills.
+    _BUFFER_ROWS = 512
+
     def __init__(
         self,
         encoder_model: Any, 
@@ -34,23 +107,41 @@ class SemanticChunker:
     def chunk(self, pages: List[Dict], doc_id: str) -> List[Dict]:
         sentences, sentence_pages = self._split_into_sentences(pages)
 
-        # Embed + normalize sentences
-        # Use the injected model
-        embeddings = self.model.encode(sentences, convert_to_numpy=True)
-        embeddings = self._normalize_embeddings(embeddings)
+        # Token estimates computed once up front; the loop, overlap
+        # carry-over, and chunk records all reuse them instead of
+        # re-walking sentence strings.
+        token_counts = np.fromiter(
+            (self._estimate_tokens(s) for s in sentences),
+            dtype=np.int32,
+            count=len(sentences),
+        )
 
         chunks = []
 
         current_sentences = []
-        current_embeddings = []
+        current_counts = []
         current_tokens = 0
 
-        for i, sentence in enumerate(sentences):
-            sentence_tokens = self._estimate_tokens(sentence)
-            sentence_embedding = embeddings[i]
+        # Embeddings for the open chunk live in a small preallocated
+        # buffer with a write pointer — appending is a row write, the
+        # overlap carry-over is a small block copy, and the similarity
+        # window is a view instead of a list-of-arrays re-packed per
+        # iteration. Sized lazily once the embedding dim is known.
+        buffer: Optional[np.ndarray] = None
+        pointer = 0
+
+        for i, sentence_embedding in enumerate(self._iter_embeddings(sentences)):
+            sentence = sentences[i]
+            sentence_tokens = int(token_counts[i])
+            if buffer is None:
+                buffer = np.empty(
+                    (self._BUFFER_ROWS, sentence_embedding.shape[0]),
+                    dtype=np.float32,
+                )
 
             similarity = self._compute_similarity(
-                sentence_embedding, current_embeddings
+                sentence_embedding,
+                buffer[max(0, pointer - self.window_size): pointer],
             )
 
             should_split = (
@@ -59,6 +150,7 @@ class SemanticChunker:
                     similarity < self.similarity_threshold
                     and current_tokens >= self.min_tokens
                 )
+                or pointer == self._BUFFER_ROWS
             )
 
             if should_split and current_sentences:
@@ -69,18 +161,22 @@ class SemanticChunker:
                         sentence_pages,
                         start_idx=i - len(current_sentences),
                         end_idx=i - 1,
+                        token_count=current_tokens,
                     )
                 )
 
                 # overlap
-                current_sentences = self._get_overlap(current_sentences)
-                current_embeddings = current_embeddings[-len(current_sentences):]
-                current_tokens = sum(
-                    self._estimate_tokens(s) for s in current_sentences
-                )
+                keep = self._overlap_count(current_counts)
+                current_sentences = current_sentences[-keep:]
+                current_counts = current_counts[-keep:]
+                buffer[:keep] = buffer[pointer - keep: pointer].copy()
+                pointer = keep
+                current_tokens = sum(current_counts)
 
             current_sentences.append(sentence)
-            current_embeddings.append(sentence_embedding)
+            current_counts.append(sentence_tokens)
+            buffer[pointer] = sentence_embedding
+            pointer += 1
             current_tokens += sentence_tokens
 
         if current_sentences:
@@ -91,12 +187,34 @@ class SemanticChunker:
                     sentence_pages,
                     start_idx=len(sentences) - len(current_sentences),
                     end_idx=len(sentences) - 1,
+                    token_count=current_tokens,
                 )
             )
 
         return chunks
 
     # Internal helpers
+    def _iter_embeddings(self, sentences: List[str]):
+        """
+        Encode sentences slice by slice, yielding rows in document order.
+
+        Streaming keeps peak embedding memory at one slice (O(slice x d))
+        instead of the whole document (O(N x d)) — the loop only ever
+        needs the open chunk's rows, not the full matrix. Large batches
+        keep the device busy (the default of 32 leaves a GPU mostly
+        idle), and normalization happens inside encode, fused with the
+        forward pass instead of a second array walk.
+        """
+        for start in range(0, len(sentences), self._ENCODE_SLICE):
+            batch = self.model.encode(
+                sentences[start : start + self._ENCODE_SLICE],
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=256 if settings.USE_GPU else 64,
+                show_progress_bar=False,
+            )
+            yield from np.ascontiguousarray(batch, dtype=np.float32)
+
     def _split_into_sentences(self, pages: List[Dict]):
         sentences = []
         sentence_pages = []
@@ -105,14 +223,7 @@ class SemanticChunker:
             page_num = page["page_num"]
             text = page["text"]
 
-            # Conservative academic sentence splitting
-            parts = re.split(
-                r"(?<!et al)(?<!Fig)(?<!Eq)(?<!Dr)(?<!Mr)(?<!Ms)(?<=[.!?])\s+",
-                text,
-            )
-
-            for s in parts:
-                s = s.strip()
+            for s in map(str.strip, self._SENTENCE_SPLIT_RE.split(text)):
                 if len(s) > 20:  # ignore junk fragments
                     sentences.append(s)
                     sentence_pages.append(page_num)
@@ -123,37 +234,34 @@ class SemanticChunker:
         # lightweight, consistent approximation
         return max(1, int(len(text) / 4))
 
-    def _normalize_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        return embeddings / np.clip(norms, 1e-10, None)
-
     def _compute_similarity(
         self,
         sentence_embedding: np.ndarray,
-        current_embeddings: List[np.ndarray],
+        window: np.ndarray,
     ) -> float:
-        if not current_embeddings:
+        if window.shape[0] == 0:
             return 1.0
 
-        # use recent window to reduce centroid drift
-        window = current_embeddings[-self.window_size :]
-        centroid = np.mean(window, axis=0, keepdims=True)
-
-        return cosine_similarity(
-            sentence_embedding.reshape(1, -1), centroid
-        )[0][0]
+        # the recent window reduces centroid drift; embeddings are
+        # L2-normalized, so cosine against the (unnormalized) window mean
+        # is a dot product scaled by the mean's norm — no sklearn wrapper,
+        # no per-call validation.
+        centroid = window[0] if window.shape[0] == 1 else window.sum(axis=0)
+        norm = float(np.linalg.norm(centroid))
+        if norm < 1e-10:
+            return 0.0
+        return float(sentence_embedding @ centroid) / norm
 
-    def _get_overlap(self, sentences: List[str]) -> List[str]:
+    def _overlap_count(self, counts: List[int]) -> int:
+        """Number of trailing sentences to carry over as chunk overlap."""
         tokens = 0
-        overlap = []
-
-        for s in reversed(sentences):
-            tokens += self._estimate_tokens(s)
-            overlap.insert(0, s)
+        keep = 0
+        for c in reversed(counts):
+            tokens += c
+            keep += 1
             if tokens >= self.overlap_tokens:
                 break
-
-        return overlap
+        return keep
 
     def _build_chunk(
         self,
@@ -162,14 +270,16 @@ class SemanticChunker:
         sentence_pages: List[int],
         start_idx: int,
         end_idx: int,
+        token_count: int,
     ) -> Dict:
-        pages = sentence_pages[start_idx : end_idx + 1]
-
         return {
             "chunk_id": str(uuid.uuid4()),
             "doc_id": doc_id,
             "text": " ".join(sentences),
-            "page_start": min(pages),
-            "page_end": max(pages),
-            "token_count": sum(self._estimate_tokens(s) for s in sentences),
+            # sentence_pages is non-decreasing (sentences come out in
+            # reading order), so the span endpoints are the min/max — no
+            # slice copy or scan needed.
+            "page_start": sentence_pages[start_idx],
+            "page_end": sentence_pages[end_idx],
+            "token_count": token_count,
         }
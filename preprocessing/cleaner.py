@@ -1,6 +1,15 @@
 import re
 from typing import List, Dict
 
+# Compiled once at import — these run over every page of every document.
+# The boilerplate patterns are merged into one alternation so each page
+# is scanned once instead of once per pattern.
+_WHITESPACE_RE = re.compile(r"\s+")
+_BOILERPLATE_RE = re.compile(
+    r"arXiv:\d+\.\d+(?:v\d+)?|©.*?All rights reserved\.",
+    re.IGNORECASE,
+)
+
 
 def clean_pages(pages: List[Dict]) -> List[Dict]:
     """
@@ -22,12 +31,9 @@ def clean_pages(pages: List[Dict]) -> List[Dict]:
     for page in pages:
         text = page["text"]
 
-        # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove common boilerplate patterns
-        text = re.sub(r"arXiv:\d+\.\d+(v\d+)?", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"©.*?All rights reserved\.", "", text, flags=re.IGNORECASE)
+        # Remove excessive whitespace, then common boilerplate patterns
+        text = _WHITESPACE_RE.sub(" ", text)
+        text = _BOILERPLATE_RE.sub("", text)
 
         cleaned.append(
             {
@@ -1,8 +1,60 @@
-from typing import List, Dict
+import functools
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import List, Dict, Tuple
 
 import numpy as np
 from sentence_transformers import CrossEncoder
 
+from configs.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Cross-encoder scores kept per reranker, keyed by (query hash, chunk id)
+_SCORE_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=4)
+def load_cross_encoder(model_name: str, device: str) -> CrossEncoder:
+    """
+    Load a cross-encoder once per (model_name, device), process-wide.
+
+    Mirrors embeddings.encoder.load_sentence_transformer: rerankers are
+    used read-only through .predict(), so every CrossEncoderReranker
+    instance (tests, scripts, workers) can share one weight load. The
+    fp16 and torch.compile treatments live here so they are applied
+    exactly once per loaded model.
+    """
+    from embeddings.encoder import configure_torch
+    configure_torch()
+
+    model = CrossEncoder(model_name, device=device)
+
+    # fp16 on GPU mirrors the shared encoder: half the bandwidth per
+    # (query, passage) forward, negligible score drift.
+    if device == "cuda" and settings.ENCODER_FP16:
+        try:
+            model.model = model.model.half()
+        except Exception as e:
+            logger.warning("fp16 unavailable for reranker: %s", e)
+
+    # The reranker always scores a small, near-fixed candidate set, so
+    # the per-call Python/dispatch overhead of eager PyTorch is a real
+    # fraction of its runtime — torch.compile specializes it away.
+    # First-call compilation is paid during the startup warmup.
+    if settings.TORCH_COMPILE_RERANKER:
+        try:
+            import torch
+            model.model = torch.compile(
+                model.model, mode="reduce-overhead", dynamic=False
+            )
+            logger.info("Reranker model wrapped with torch.compile.")
+        except Exception as e:
+            logger.warning("torch.compile unavailable for reranker: %s", e)
+
+    return model
+
 
 class CrossEncoderReranker:
     """
@@ -30,8 +82,14 @@ class CrossEncoderReranker:
         max_passages : int
             Maximum number of retrieved passages to re-rank.
         """
-        self.model = CrossEncoder(model_name)
+        self.model = load_cross_encoder(
+            model_name, "cuda" if settings.USE_GPU else "cpu"
+        )
         self.max_passages = max_passages
+        # Re-issued queries (follow-ups, retries) re-score the same
+        # (query, chunk) pairs; caching the scalar score skips the
+        # cross-encoder forward for every previously seen pair.
+        self._score_cache: "OrderedDict[Tuple[bytes, str], float]" = OrderedDict()
 
     def rerank(
         self,
@@ -63,18 +121,44 @@ class CrossEncoderReranker:
 
         candidates = retrieved_chunks[: self.max_passages]
 
-        query_passage_pairs = [
-            (query, chunk["text"]) for chunk in candidates
+        query_hash = hashlib.blake2b(query.encode("utf-8"), digest_size=8).digest()
+        # Indexed chunks always carry a chunk_id; synthetic payloads (the
+        # startup warmup, ad-hoc scoring) may not, so fall back to hashing
+        # the passage text — rerank only promises a 'text' field.
+        keys = [
+            (
+                query_hash,
+                chunk.get("chunk_id")
+                or hashlib.blake2b(
+                    chunk["text"].encode("utf-8"), digest_size=8
+                ).digest(),
+            )
+            for chunk in candidates
         ]
-
-        scores = self.model.predict(query_passage_pairs)
+        missing = [i for i, key in enumerate(keys) if key not in self._score_cache]
+
+        if missing:
+            # One batch covers the whole candidate set — a single forward
+            # pass instead of the default batch-of-32 chunking plus
+            # progress bookkeeping.
+            scores = self.model.predict(
+                [(query, candidates[i]["text"]) for i in missing],
+                batch_size=self.max_passages,
+                show_progress_bar=False,
+            )
+            for i, score in zip(missing, scores):
+                self._score_cache[keys[i]] = float(score)
 
         scored_chunks = []
-        for chunk, score in zip(candidates, scores):
+        for chunk, key in zip(candidates, keys):
             enriched = dict(chunk)
-            enriched["cross_score"] = float(score)
+            enriched["cross_score"] = self._score_cache[key]
+            self._score_cache.move_to_end(key)
             scored_chunks.append(enriched)
 
+        while len(self._score_cache) > _SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+
         scored_chunks.sort(
             key=lambda x: x["cross_score"], reverse=True
         )
@@ -1,5 +1,7 @@
 import faiss
+import math
 import numpy as np
+import orjson
 import pickle
 import logging
 from typing import List, Dict, Set, Optional
@@ -13,6 +15,12 @@ class FaissIndex:
     """
     In-memory vector store wrapper around FAISS.
     Supports document-level tracking and index lifecycle management.
+
+    Small corpora use an exact flat inner-product index. Once the chunk
+    count crosses ``settings.FAISS_IVF_MIN_CHUNKS`` the index is migrated
+    to IVF-PQ (coarse Voronoi partitioning + product quantization), which
+    turns the O(N·D) flat scan into a probe of a few cells — the flat scan
+    is memory-bandwidth bound and dominates query latency on large indexes.
     """
 
     def __init__(
@@ -24,19 +32,51 @@ class FaissIndex:
         self.index_path = index_path or settings.FAISS_INDEX_PATH
         self.meta_path = meta_path or settings.FAISS_META_PATH
         self.dim = dim
-        self.index = faiss.IndexFlatIP(dim)
+        self.index = self._new_base_index()
         self.chunks: List[Dict] = []
+        # Positions tombstoned by remove_document() on index types that
+        # cannot compact in place (IVF-PQ, GPU); filtered at search time.
+        self._deleted: Set[int] = set()
+        # Live doc-id set, maintained incrementally so /index/status polls
+        # don't pay a full metadata scan.
+        self._doc_ids: Set[str] = set()
+        self._gpu_resources = None
 
         # Ensure directory exists
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _new_base_index(self) -> "faiss.Index":
+        """
+        Create the exact-search base index.
+
+        With FAISS_FP16 vectors are stored as fp16 scalar-quantized codes:
+        half the bytes per vector, which roughly doubles candidate
+        throughput on a memory-bound scan and halves the index file size.
+        FAISS_INT8 goes further (4x fewer bytes than fp32) at the cost of
+        a range-training step on the first added batch. Queries stay
+        float32 — FAISS dequantizes per comparison.
+        """
+        if settings.FAISS_INT8:
+            return faiss.IndexScalarQuantizer(
+                self.dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        if settings.FAISS_FP16:
+            return faiss.IndexScalarQuantizer(
+                self.dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+            )
+        return faiss.IndexFlatIP(self.dim)
+
+    def _is_exact_index(self) -> bool:
+        """True while the index is still a flat/SQ exact scan (pre-IVF-PQ)."""
+        return isinstance(self.index, (faiss.IndexFlatIP, faiss.IndexScalarQuantizer))
+
     @property
     def document_count(self) -> int:
         return len(self.get_doc_ids())
 
     @property
     def chunk_count(self) -> int:
-        return len(self.chunks)
+        return len(self.chunks) - len(self._deleted)
 
     def load_or_create(self):
         """Load index if it exists, otherwise start empty."""
@@ -50,21 +90,106 @@ class FaissIndex:
         else:
             logger.info("No existing index found, starting fresh.")
 
+        if settings.USE_GPU:
+            self._to_gpu()
+
+    def _to_gpu(self):
+        """
+        Move the index to GPU 0 when FAISS has GPU support compiled in.
+
+        GPU flat search is already sub-millisecond at this scale, so a
+        GPU-resident index skips the IVF-PQ migration; per-document
+        removal falls back to tombstoning (remove_ids is CPU-only).
+        """
+        try:
+            self._gpu_resources = faiss.StandardGpuResources()
+        except AttributeError:
+            logger.warning("faiss-gpu not installed — keeping index on CPU.")
+            return
+        self.index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.index)
+        logger.info("FAISS index moved to GPU 0.")
+
     def add(self, chunks: List[Dict]):
         """Add chunks with embeddings to the FAISS index."""
         if not chunks:
             return
 
-        vectors = np.vstack([c["embedding"] for c in chunks]).astype("float32")
-        self.index.add(vectors)
+        # Fill a preallocated matrix row by row — vstack + astype built
+        # the matrix twice (stack copy, then dtype-cast copy); here each
+        # embedding is copied exactly once, casting on assignment.
+        vectors = np.empty((len(chunks), self.dim), dtype=np.float32)
+        for i, c in enumerate(chunks):
+            vectors[i] = c["embedding"]
+
+        if self._should_migrate_to_ann(len(chunks)):
+            self._migrate_to_ann(vectors)
+        else:
+            # int8 scalar quantization needs per-dimension ranges; the
+            # first batch is representative enough for normalized MiniLM.
+            if not self.index.is_trained:
+                self.index.train(vectors)
+            self.index.add(vectors)
 
         # Store chunks WITHOUT the embedding to save memory/disk
         for c in chunks:
             meta = {k: v for k, v in c.items() if k != "embedding"}
             self.chunks.append(meta)
+            self._doc_ids.add(meta.get("doc_id", "unknown"))
 
         logger.info("Added %d chunks to index (total: %d)", len(chunks), self.chunk_count)
 
+    def _should_migrate_to_ann(self, incoming_count: int) -> bool:
+        """Migrate only once, when an exact index grows past the threshold."""
+        if not self._is_exact_index():
+            return False
+        return self.index.ntotal + incoming_count >= settings.FAISS_IVF_MIN_CHUNKS
+
+    def _migrate_to_ann(self, new_vectors: np.ndarray):
+        """
+        Rebuild the flat index as the configured ANN structure.
+
+        IVF-PQ trains on all vectors seen so far; the trained index
+        (including its quantizer) is persisted by save(), so subsequent
+        uploads only pay for add(), never retraining. HNSW needs no
+        training — vectors are inserted into the graph directly — and
+        trades RAM (full fp32 vectors) for better recall at the same
+        latency.
+        """
+        if self.index.ntotal > 0:
+            existing = self.index.reconstruct_n(0, self.index.ntotal)
+            train_vectors = np.vstack([existing, new_vectors])
+        else:
+            train_vectors = new_vectors
+
+        if settings.FAISS_ANN_INDEX == "hnsw":
+            index = faiss.IndexHNSWFlat(
+                self.dim, settings.FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = 80
+            index.add(train_vectors)
+            self.index = index
+            logger.info(
+                "Migrated index to HNSW: %d vectors, M=%d",
+                index.ntotal, settings.FAISS_HNSW_M,
+            )
+            return
+
+        nlist = max(1, int(4 * math.sqrt(len(train_vectors))))
+        quantizer = faiss.IndexFlatIP(self.dim)
+        # m=48 sub-quantizers → 8-dim sub-vectors for 384-d embeddings
+        index = faiss.IndexIVFPQ(
+            quantizer, self.dim, nlist, 48, 8, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(train_vectors)
+        index.nprobe = settings.FAISS_NPROBE
+        index.add(train_vectors)
+
+        self.index = index
+        logger.info(
+            "Migrated index to IVF-PQ: %d vectors, nlist=%d, nprobe=%d",
+            index.ntotal, nlist, index.nprobe,
+        )
+
     def search(
         self, 
         query_embedding: np.ndarray, 
@@ -78,36 +203,131 @@ class FaissIndex:
         if self.index.ntotal == 0:
             return []
 
-        # If filtering is active, we fetch more items to ensure we get 
+        # If filtering is active, we fetch more items to ensure we get
         # enough valid results after filtering.
-        fetch_k = top_k * 3 if doc_ids else top_k
-        
+        fetch_k = top_k * 3 if (doc_ids or self._deleted) else top_k
+
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = max(
+                fetch_k * 4, settings.FAISS_HNSW_EF_SEARCH
+            )
+
         scores, indices = self.index.search(
             query_embedding.reshape(1, -1).astype("float32"), fetch_k
         )
 
+        return self._collect_hits(scores[0], indices[0], top_k, doc_ids)
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        top_k: int,
+        doc_ids: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Search the index for several queries in one FAISS call.
+
+        FAISS parallelizes over the query axis internally (one OpenMP
+        task per query on CPU, one kernel launch on GPU), so a single
+        batched search is much cheaper than a Python loop of per-query
+        calls. Returns one result list per query row, in order.
+        """
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(query_embeddings))]
+
+        fetch_k = top_k * 3 if (doc_ids or self._deleted) else top_k
+
+        if hasattr(self.index, "hnsw"):
+            self.index.hnsw.efSearch = max(
+                fetch_k * 4, settings.FAISS_HNSW_EF_SEARCH
+            )
+
+        queries = np.ascontiguousarray(query_embeddings, dtype="float32")
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        scores, indices = self.index.search(queries, fetch_k)
+
+        return [
+            self._collect_hits(scores[row], indices[row], top_k, doc_ids)
+            for row in range(len(queries))
+        ]
+
+    def _collect_hits(
+        self,
+        scores: np.ndarray,
+        indices: np.ndarray,
+        top_k: int,
+        doc_ids: Optional[List[str]],
+    ) -> List[Dict]:
+        """Turn one query's raw FAISS hits into filtered chunk dicts."""
         results = []
-        for score, idx in zip(scores[0], indices[0]):
+        for score, idx in zip(scores, indices):
             if idx >= 0 and idx < len(self.chunks):
+                if idx in self._deleted:
+                    continue
                 chunk = self.chunks[idx]
-                
+
                 # Filter by doc_id if provided
                 if doc_ids and chunk.get("doc_id") not in doc_ids:
                     continue
-                    
-                result = dict(chunk)
-                result["similarity_score"] = float(score)
-                results.append(result)
-                
+
+                # C-level dict merge: one allocation per hit instead of
+                # dict() construction followed by a separate insert.
+                results.append({**chunk, "similarity_score": float(score)})
+
                 if len(results) >= top_k:
                     break
 
         return results
 
+    def remove_document(self, doc_id: str) -> int:
+        """
+        Remove a single document's chunks without rebuilding the index.
+
+        Returns the number of chunks removed. On a flat index the vectors
+        are physically removed (remove_ids compacts in insertion order, so
+        the metadata list is compacted in lockstep). IVF-PQ codes cannot
+        be exactly reconstructed for compaction, so there the positions
+        are tombstoned and filtered out of search results instead.
+        """
+        positions = [
+            i
+            for i, chunk in enumerate(self.chunks)
+            if chunk.get("doc_id") == doc_id and i not in self._deleted
+        ]
+        if not positions:
+            return 0
+
+        if self._is_exact_index():
+            self.index.remove_ids(np.asarray(positions, dtype="int64"))
+            position_set = set(positions)
+            self.chunks = [
+                c for i, c in enumerate(self.chunks) if i not in position_set
+            ]
+            # Shift any remaining tombstones down past the removed rows
+            self._deleted = {
+                i - sum(1 for p in positions if p < i)
+                for i in self._deleted
+                if i not in position_set
+            }
+        else:
+            self._deleted.update(positions)
+
+        self._doc_ids.discard(doc_id)
+        logger.info(
+            "Removed document %s: %d chunks (%d remaining)",
+            doc_id, len(positions), self.chunk_count,
+        )
+        return len(positions)
+
     def clear(self):
         """Reset the index to empty and delete persisted files."""
-        self.index = faiss.IndexFlatIP(self.dim)
+        self.index = self._new_base_index()
+        if self._gpu_resources is not None:
+            self.index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.index)
         self.chunks = []
+        self._deleted = set()
+        self._doc_ids = set()
 
         if self.index_path.exists():
             self.index_path.unlink()
@@ -117,18 +337,60 @@ class FaissIndex:
         logger.info("Index cleared.")
 
     def get_doc_ids(self) -> Set[str]:
-        """Return the set of unique document IDs in the index."""
-        return {c.get("doc_id", "unknown") for c in self.chunks}
+        """Return the set of unique document IDs in the index. O(1)."""
+        return self._doc_ids
 
     def save(self):
         """Persist the FAISS index and chunk metadata to disk."""
-        faiss.write_index(self.index, str(self.index_path))
+        index = self.index
+        if self._gpu_resources is not None:
+            index = faiss.index_gpu_to_cpu(index)
+        faiss.write_index(index, str(self.index_path))
+        # Chunk metadata is plain str/int dicts, so orjson's C serializer
+        # applies: several times faster than pickle on load and a smaller
+        # file with no Python class/reduce framing.
         with open(self.meta_path, "wb") as f:
-            pickle.dump(self.chunks, f)
+            f.write(
+                orjson.dumps(
+                    {"chunks": self.chunks, "deleted": sorted(self._deleted)}
+                )
+            )
         logger.info("Index saved: %d chunks.", self.chunk_count)
 
     def load(self):
         """Load the FAISS index and chunk metadata from disk."""
-        self.index = faiss.read_index(str(self.index_path))
+        if settings.FAISS_MMAP:
+            try:
+                # OS pages vectors in on demand: faster startup and a much
+                # smaller resident set for large indexes. The index is
+                # read-only in this mode, so it only suits query serving.
+                self.index = faiss.read_index(
+                    str(self.index_path),
+                    faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY,
+                )
+            except RuntimeError as e:
+                logger.warning("mmap load failed (%s) — reading index into RAM.", e)
+                self.index = faiss.read_index(str(self.index_path))
+        else:
+            self.index = faiss.read_index(str(self.index_path))
+        if hasattr(self.index, "nprobe"):
+            self.index.nprobe = settings.FAISS_NPROBE
         with open(self.meta_path, "rb") as f:
-            self.chunks = pickle.load(f)
+            raw = f.read()
+        if raw.startswith(b"{"):
+            payload = orjson.loads(raw)
+        else:
+            # Legacy pickle formats: a payload dict or a bare chunk list
+            payload = pickle.loads(raw)
+        if isinstance(payload, dict):
+            self.chunks = payload["chunks"]
+            self._deleted = set(payload.get("deleted", ()))
+        else:
+            self.chunks = payload
+            self._deleted = set()
+        # One scan at load time; kept incremental afterwards
+        self._doc_ids = {
+            c.get("doc_id", "unknown")
+            for i, c in enumerate(self.chunks)
+            if i not in self._deleted
+        }
@@ -0,0 +1,53 @@
+"""
+Regression tests for the startup warmup path.
+
+The warmup payloads are synthetic (no chunk_id, no index), so they
+exercise code paths real requests never hit — and _warm_models swallows
+exceptions by design, so a broken warmup fails silently in production.
+These tests run the real rerank code against the warmup payload to keep
+that from recurring.
+"""
+
+import logging
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from retrieval.cross_encoder import CrossEncoderReranker
+
+
+def _reranker_with_stub_model():
+    with patch("retrieval.cross_encoder.load_cross_encoder") as load:
+        load.return_value.predict.return_value = np.array([0.5])
+        return CrossEncoderReranker()
+
+
+class TestWarmup:
+
+    def test_rerank_accepts_chunks_without_chunk_id(self):
+        """The warmup payload has no chunk_id; rerank must not KeyError."""
+        reranker = _reranker_with_stub_model()
+
+        results = reranker.rerank("warmup", [{"text": "warmup"}], top_n=1)
+
+        assert len(results) == 1
+        assert "cross_score" in results[0]
+
+    def test_warm_models_emits_no_warnings(self, caplog):
+        """_warm_models must run every phase cleanly — a warmup failure is
+        only logged, so a regression here would silently skip warmup."""
+        pytest.importorskip("fastapi")  # api.app pulls in the API stack
+        from api.app import _warm_models
+
+        reranker = _reranker_with_stub_model()
+        encoder = MagicMock()
+
+        with patch("api.dependencies.get_encoder", return_value=encoder), \
+             patch("api.dependencies.get_reranker", return_value=reranker):
+            with caplog.at_level(logging.WARNING):
+                _warm_models()
+
+        warnings = [r for r in caplog.records if "Warmup" in r.getMessage()]
+        assert warnings == []
+        encoder.embed_query.assert_called_once()